@@ -0,0 +1,205 @@
+# Skill taxonomy and precomputed similarity scores shared by the dashboard and the HTTP API
+
+# Define skill categories
+skills_by_category = {
+    "Programming Languages": ["Python", "Java", "C++", "JavaScript", "R", "TypeScript"],
+    "Web Technologies": ["HTML", "CSS", "React", "Angular", "Node.js", "REST API"],
+    "Databases": ["SQL", "MongoDB", "PostgreSQL", "MySQL", "NoSQL"],
+    "Cloud & DevOps": ["AWS", "Docker", "Kubernetes", "Git", "CI/CD", "Linux"],
+    "Data Science & AI": ["TensorFlow", "PyTorch", "machine learning", "NLP", "data visualization"],
+    "Tools & Practices": ["Agile", "Scrum", "testing", "debugging", "version control", "security"]
+}
+
+# Flatten skills list while preserving category information
+skills_with_categories = [(skill, category) for category, skill_list in skills_by_category.items() for skill in
+                          skill_list]
+skills = [skill for skill, _ in skills_with_categories]
+skill_to_category = {skill: category for skill, category in skills_with_categories}
+
+
+# Precomputed similarity scores for demonstration (simulating embeddings)
+# These would normally come from a model like SentenceTransformer
+def get_simulated_scores():
+    # Structure: {course_name: {skill: {course_score, job_score, standard_score}}}
+    return {
+        "Introduction to Programming": {
+            "Python": {"course": 0.85, "job": 0.90, "standard": 0.75},
+            "Java": {"course": 0.30, "job": 0.85, "standard": 0.65},
+            "JavaScript": {"course": 0.20, "job": 0.80, "standard": 0.60},
+            "C++": {"course": 0.25, "job": 0.75, "standard": 0.70},
+            "R": {"course": 0.15, "job": 0.65, "standard": 0.40},
+            "TypeScript": {"course": 0.10, "job": 0.70, "standard": 0.45},
+            "HTML": {"course": 0.25, "job": 0.75, "standard": 0.50},
+            "CSS": {"course": 0.20, "job": 0.75, "standard": 0.50},
+            "React": {"course": 0.10, "job": 0.80, "standard": 0.55},
+            "Angular": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "Node.js": {"course": 0.10, "job": 0.75, "standard": 0.50},
+            "REST API": {"course": 0.15, "job": 0.80, "standard": 0.60},
+            "SQL": {"course": 0.30, "job": 0.85, "standard": 0.70},
+            "MongoDB": {"course": 0.10, "job": 0.75, "standard": 0.50},
+            "PostgreSQL": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "MySQL": {"course": 0.15, "job": 0.70, "standard": 0.50},
+            "NoSQL": {"course": 0.05, "job": 0.65, "standard": 0.45},
+            "AWS": {"course": 0.15, "job": 0.80, "standard": 0.55},
+            "Docker": {"course": 0.10, "job": 0.75, "standard": 0.60},
+            "Kubernetes": {"course": 0.05, "job": 0.70, "standard": 0.50},
+            "Git": {"course": 0.30, "job": 0.85, "standard": 0.75},
+            "CI/CD": {"course": 0.10, "job": 0.75, "standard": 0.65},
+            "Linux": {"course": 0.25, "job": 0.80, "standard": 0.60},
+            "TensorFlow": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "PyTorch": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "machine learning": {"course": 0.15, "job": 0.75, "standard": 0.55},
+            "NLP": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "data visualization": {"course": 0.25, "job": 0.70, "standard": 0.55},
+            "Agile": {"course": 0.15, "job": 0.80, "standard": 0.70},
+            "Scrum": {"course": 0.10, "job": 0.75, "standard": 0.65},
+            "testing": {"course": 0.35, "job": 0.85, "standard": 0.75},
+            "debugging": {"course": 0.70, "job": 0.80, "standard": 0.75},
+            "version control": {"course": 0.30, "job": 0.85, "standard": 0.70},
+            "security": {"course": 0.20, "job": 0.80, "standard": 0.75}
+        },
+        "Data Structures": {
+            "Python": {"course": 0.70, "job": 0.90, "standard": 0.75},
+            "Java": {"course": 0.85, "job": 0.85, "standard": 0.65},
+            "JavaScript": {"course": 0.15, "job": 0.80, "standard": 0.60},
+            "C++": {"course": 0.75, "job": 0.75, "standard": 0.70},
+            "R": {"course": 0.10, "job": 0.65, "standard": 0.40},
+            "TypeScript": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "HTML": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "CSS": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "React": {"course": 0.05, "job": 0.80, "standard": 0.55},
+            "Angular": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "Node.js": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "REST API": {"course": 0.10, "job": 0.80, "standard": 0.60},
+            "SQL": {"course": 0.15, "job": 0.85, "standard": 0.70},
+            "MongoDB": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "PostgreSQL": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "MySQL": {"course": 0.10, "job": 0.70, "standard": 0.50},
+            "NoSQL": {"course": 0.05, "job": 0.65, "standard": 0.45},
+            "AWS": {"course": 0.05, "job": 0.80, "standard": 0.55},
+            "Docker": {"course": 0.05, "job": 0.75, "standard": 0.60},
+            "Kubernetes": {"course": 0.05, "job": 0.70, "standard": 0.50},
+            "Git": {"course": 0.20, "job": 0.85, "standard": 0.75},
+            "CI/CD": {"course": 0.05, "job": 0.75, "standard": 0.65},
+            "Linux": {"course": 0.15, "job": 0.80, "standard": 0.60},
+            "TensorFlow": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "PyTorch": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "machine learning": {"course": 0.10, "job": 0.75, "standard": 0.55},
+            "NLP": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "data visualization": {"course": 0.10, "job": 0.70, "standard": 0.55},
+            "Agile": {"course": 0.10, "job": 0.80, "standard": 0.70},
+            "Scrum": {"course": 0.05, "job": 0.75, "standard": 0.65},
+            "testing": {"course": 0.30, "job": 0.85, "standard": 0.75},
+            "debugging": {"course": 0.40, "job": 0.80, "standard": 0.75},
+            "version control": {"course": 0.15, "job": 0.85, "standard": 0.70},
+            "security": {"course": 0.10, "job": 0.80, "standard": 0.75}
+        },
+        "Algorithms": {
+            "Python": {"course": 0.60, "job": 0.90, "standard": 0.75},
+            "Java": {"course": 0.65, "job": 0.85, "standard": 0.65},
+            "JavaScript": {"course": 0.10, "job": 0.80, "standard": 0.60},
+            "C++": {"course": 0.70, "job": 0.75, "standard": 0.70},
+            "R": {"course": 0.15, "job": 0.65, "standard": 0.40},
+            "TypeScript": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "HTML": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "CSS": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "React": {"course": 0.05, "job": 0.80, "standard": 0.55},
+            "Angular": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "Node.js": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "REST API": {"course": 0.10, "job": 0.80, "standard": 0.60},
+            "SQL": {"course": 0.15, "job": 0.85, "standard": 0.70},
+            "MongoDB": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "PostgreSQL": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "MySQL": {"course": 0.05, "job": 0.70, "standard": 0.50},
+            "NoSQL": {"course": 0.05, "job": 0.65, "standard": 0.45},
+            "AWS": {"course": 0.05, "job": 0.80, "standard": 0.55},
+            "Docker": {"course": 0.05, "job": 0.75, "standard": 0.60},
+            "Kubernetes": {"course": 0.05, "job": 0.70, "standard": 0.50},
+            "Git": {"course": 0.15, "job": 0.85, "standard": 0.75},
+            "CI/CD": {"course": 0.05, "job": 0.75, "standard": 0.65},
+            "Linux": {"course": 0.10, "job": 0.80, "standard": 0.60},
+            "TensorFlow": {"course": 0.20, "job": 0.70, "standard": 0.45},
+            "PyTorch": {"course": 0.15, "job": 0.65, "standard": 0.40},
+            "machine learning": {"course": 0.35, "job": 0.75, "standard": 0.55},
+            "NLP": {"course": 0.25, "job": 0.65, "standard": 0.40},
+            "data visualization": {"course": 0.10, "job": 0.70, "standard": 0.55},
+            "Agile": {"course": 0.05, "job": 0.80, "standard": 0.70},
+            "Scrum": {"course": 0.05, "job": 0.75, "standard": 0.65},
+            "testing": {"course": 0.30, "job": 0.85, "standard": 0.75},
+            "debugging": {"course": 0.35, "job": 0.80, "standard": 0.75},
+            "version control": {"course": 0.10, "job": 0.85, "standard": 0.70},
+            "security": {"course": 0.10, "job": 0.80, "standard": 0.75}
+        },
+        "Web Development": {
+            "Python": {"course": 0.35, "job": 0.90, "standard": 0.75},
+            "Java": {"course": 0.25, "job": 0.85, "standard": 0.65},
+            "JavaScript": {"course": 0.90, "job": 0.80, "standard": 0.60},
+            "C++": {"course": 0.10, "job": 0.75, "standard": 0.70},
+            "R": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "TypeScript": {"course": 0.60, "job": 0.70, "standard": 0.45},
+            "HTML": {"course": 0.95, "job": 0.75, "standard": 0.50},
+            "CSS": {"course": 0.95, "job": 0.75, "standard": 0.50},
+            "React": {"course": 0.75, "job": 0.80, "standard": 0.55},
+            "Angular": {"course": 0.50, "job": 0.70, "standard": 0.45},
+            "Node.js": {"course": 0.70, "job": 0.75, "standard": 0.50},
+            "REST API": {"course": 0.65, "job": 0.80, "standard": 0.60},
+            "SQL": {"course": 0.30, "job": 0.85, "standard": 0.70},
+            "MongoDB": {"course": 0.55, "job": 0.75, "standard": 0.50},
+            "PostgreSQL": {"course": 0.25, "job": 0.70, "standard": 0.45},
+            "MySQL": {"course": 0.40, "job": 0.70, "standard": 0.50},
+            "NoSQL": {"course": 0.40, "job": 0.65, "standard": 0.45},
+            "AWS": {"course": 0.25, "job": 0.80, "standard": 0.55},
+            "Docker": {"course": 0.20, "job": 0.75, "standard": 0.60},
+            "Kubernetes": {"course": 0.05, "job": 0.70, "standard": 0.50},
+            "Git": {"course": 0.60, "job": 0.85, "standard": 0.75},
+            "CI/CD": {"course": 0.25, "job": 0.75, "standard": 0.65},
+            "Linux": {"course": 0.20, "job": 0.80, "standard": 0.60},
+            "TensorFlow": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "PyTorch": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "machine learning": {"course": 0.10, "job": 0.75, "standard": 0.55},
+            "NLP": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "data visualization": {"course": 0.40, "job": 0.70, "standard": 0.55},
+            "Agile": {"course": 0.35, "job": 0.80, "standard": 0.70},
+            "Scrum": {"course": 0.30, "job": 0.75, "standard": 0.65},
+            "testing": {"course": 0.40, "job": 0.85, "standard": 0.75},
+            "debugging": {"course": 0.55, "job": 0.80, "standard": 0.75},
+            "version control": {"course": 0.55, "job": 0.85, "standard": 0.70},
+            "security": {"course": 0.30, "job": 0.80, "standard": 0.75}
+        },
+        "Database Systems": {
+            "Python": {"course": 0.40, "job": 0.90, "standard": 0.75},
+            "Java": {"course": 0.25, "job": 0.85, "standard": 0.65},
+            "JavaScript": {"course": 0.15, "job": 0.80, "standard": 0.60},
+            "C++": {"course": 0.15, "job": 0.75, "standard": 0.70},
+            "R": {"course": 0.20, "job": 0.65, "standard": 0.40},
+            "TypeScript": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "HTML": {"course": 0.10, "job": 0.75, "standard": 0.50},
+            "CSS": {"course": 0.05, "job": 0.75, "standard": 0.50},
+            "React": {"course": 0.05, "job": 0.80, "standard": 0.55},
+            "Angular": {"course": 0.05, "job": 0.70, "standard": 0.45},
+            "Node.js": {"course": 0.15, "job": 0.75, "standard": 0.50},
+            "REST API": {"course": 0.30, "job": 0.80, "standard": 0.60},
+            "SQL": {"course": 0.95, "job": 0.85, "standard": 0.70},
+            "MongoDB": {"course": 0.55, "job": 0.75, "standard": 0.50},
+            "PostgreSQL": {"course": 0.75, "job": 0.70, "standard": 0.45},
+            "MySQL": {"course": 0.90, "job": 0.70, "standard": 0.50},
+            "NoSQL": {"course": 0.65, "job": 0.65, "standard": 0.45},
+            "AWS": {"course": 0.25, "job": 0.80, "standard": 0.55},
+            "Docker": {"course": 0.15, "job": 0.75, "standard": 0.60},
+            "Kubernetes": {"course": 0.05, "job": 0.70, "standard": 0.50},
+            "Git": {"course": 0.20, "job": 0.85, "standard": 0.75},
+            "CI/CD": {"course": 0.10, "job": 0.75, "standard": 0.65},
+            "Linux": {"course": 0.30, "job": 0.80, "standard": 0.60},
+            "TensorFlow": {"course": 0.10, "job": 0.70, "standard": 0.45},
+            "PyTorch": {"course": 0.05, "job": 0.65, "standard": 0.40},
+            "machine learning": {"course": 0.25, "job": 0.75, "standard": 0.55},
+            "NLP": {"course": 0.10, "job": 0.65, "standard": 0.40},
+            "data visualization": {"course": 0.45, "job": 0.70, "standard": 0.55},
+            "Agile": {"course": 0.15, "job": 0.80, "standard": 0.70},
+            "Scrum": {"course": 0.10, "job": 0.75, "standard": 0.65},
+            "testing": {"course": 0.40, "job": 0.85, "standard": 0.75},
+            "debugging": {"course": 0.50, "job": 0.80, "standard": 0.75},
+            "version control": {"course": 0.20, "job": 0.85, "standard": 0.70},
+            "security": {"course": 0.55, "job": 0.80, "standard": 0.75}
+        }
+    }
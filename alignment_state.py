@@ -0,0 +1,149 @@
+from collections import Counter
+
+# Gap and coverage analysis for one course, kept as per-skill contributions to a few
+# running totals. Changing one skill's course coverage only re-accounts that skill, which
+# makes "what-if" questions cheap enough to drive interactive widgets and greedy search.
+
+
+class AlignmentState:
+    def __init__(self, course_scores, skills, skill_to_category, threshold_job, threshold_course, gap_severity):
+        self.threshold_job = threshold_job
+        self.threshold_course = threshold_course
+        self.gap_severity = gap_severity
+        self.skill_to_category = skill_to_category
+
+        self.scores = {skill: dict(course_scores[skill]) for skill in skills if skill in course_scores}
+        self.order = {skill: i for i, skill in enumerate(self.scores)}
+        self.totals = Counter()
+        self.categories = {}
+        self.gaps = {}
+        for skill in self.scores:
+            self._account(skill, 1)
+
+    # Add (sign=1) or remove (sign=-1) one skill's contribution to the totals
+    def _account(self, skill, sign):
+        scores = self.scores[skill]
+        course_score, job_score, standard_score = scores["course"], scores["job"], scores["standard"]
+        covered = course_score >= self.threshold_course
+        job_relevant = job_score >= self.threshold_job
+        standard_relevant = standard_score >= self.threshold_job
+
+        self.totals["job_relevant"] += sign * job_relevant
+        self.totals["job_covered"] += sign * (job_relevant and covered)
+        self.totals["standard_relevant"] += sign * standard_relevant
+        self.totals["standard_covered"] += sign * (standard_relevant and covered)
+
+        category = self.skill_to_category.get(skill, "Other")
+        category_totals = self.categories.setdefault(category, Counter())
+        category_totals["total"] += sign
+        category_totals["job_relevant"] += sign * job_relevant
+        category_totals["covered"] += sign * (job_relevant and covered)
+
+        # Gap severity is weighted more toward the job market
+        overall_gap = max(0, job_score - course_score) * 0.7 + max(0, standard_score - course_score) * 0.3
+        if sign < 0:
+            self.gaps.pop(skill, None)
+        elif job_relevant and not covered and overall_gap >= self.gap_severity:
+            self.gaps[skill] = {
+                "skill": skill,
+                "category": category,
+                "course_score": course_score,
+                "job_score": job_score,
+                "standard_score": standard_score,
+                "overall_gap": overall_gap
+            }
+
+    # Change the course coverage score of a few skills, re-accounting only those skills.
+    # Returns the previous scores so the change can be reverted.
+    def apply(self, overrides):
+        previous = {}
+        for skill, course_score in overrides.items():
+            if skill not in self.scores:
+                continue
+            self._account(skill, -1)
+            previous[skill] = self.scores[skill]["course"]
+            self.scores[skill]["course"] = course_score
+            self._account(skill, 1)
+        return previous
+
+    # Summary of the state with overrides applied, leaving the state unchanged afterwards
+    def simulate(self, overrides):
+        previous = self.apply(overrides)
+        try:
+            return self.summary()
+        finally:
+            self.apply(previous)
+
+    def market_coverage(self):
+        relevant = self.totals["job_relevant"]
+        return self.totals["job_covered"] / relevant * 100 if relevant else 0
+
+    def standards_coverage(self):
+        relevant = self.totals["standard_relevant"]
+        return self.totals["standard_covered"] / relevant * 100 if relevant else 0
+
+    def health_score(self):
+        return (self.market_coverage() + self.standards_coverage()) / 2
+
+    # Gaps sorted by severity, most severe first (ties keep the skill order)
+    def skill_gaps(self):
+        return sorted(self.gaps.values(), key=lambda gap: (-gap["overall_gap"], self.order[gap["skill"]]))
+
+    # Coverage percentage of job-relevant skills per category, for the radar chart
+    def category_coverage(self):
+        return {category: totals["covered"] / totals["job_relevant"] * 100
+                for category, totals in self.categories.items() if totals["job_relevant"] > 0}
+
+    def summary(self):
+        return {
+            "market_coverage": self.market_coverage(),
+            "standards_coverage": self.standards_coverage(),
+            "health_score": self.health_score(),
+            "skill_gaps": self.skill_gaps(),
+            "category_coverage": self.category_coverage()
+        }
+
+    # Skills that are relevant to the job market or standards but not covered by the course
+    def uncovered_skills(self):
+        return [skill for skill, scores in self.scores.items()
+                if scores["course"] < self.threshold_course
+                and (scores["job"] >= self.threshold_job or scores["standard"] >= self.threshold_job)]
+
+    # Health score points gained by covering one currently uncovered skill
+    def _health_gain(self, skill):
+        scores = self.scores[skill]
+        gain = 0.0
+        if scores["job"] >= self.threshold_job:
+            gain += 50 / self.totals["job_relevant"]
+        if scores["standard"] >= self.threshold_job:
+            gain += 50 / self.totals["standard_relevant"]
+        return gain
+
+    # Greedy search for the smallest set of skills whose coverage lifts the health score
+    # to the target. Each skill's gain is independent of the others, so taking the largest
+    # gains first (ties broken by gap severity) gives the smallest set. The "reason" key is
+    # one of "already_met", "reached", "unreachable" or "below_threshold" (the assumed
+    # coverage is below the course coverage threshold, so adding skills changes nothing).
+    def smallest_skill_set(self, target_health, course_score):
+        if self.health_score() >= target_health:
+            return {"skills": [], "reached": True, "reason": "already_met", **self.summary()}
+        if course_score < self.threshold_course:
+            return {"skills": [], "reached": False, "reason": "below_threshold", **self.summary()}
+
+        candidates = sorted(
+            self.uncovered_skills(),
+            key=lambda skill: (self._health_gain(skill), self.gaps.get(skill, {}).get("overall_gap", 0)),
+            reverse=True
+        )
+
+        chosen = []
+        health = self.health_score()
+        for skill in candidates:
+            if health >= target_health:
+                break
+            chosen.append(skill)
+            health += self._health_gain(skill)
+
+        result = self.simulate({skill: course_score for skill in chosen})
+        reached = result["health_score"] >= target_health - 1e-9
+        return {"skills": chosen, "reached": reached, "reason": "reached" if reached else "unreachable", **result}
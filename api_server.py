@@ -0,0 +1,333 @@
+import argparse
+import hashlib
+import json
+import queue
+import selectors
+import socket
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from alignment_data import get_simulated_scores, skill_to_category, skills_by_category
+from alignment_state import AlignmentState
+
+# Local HTTP API exposing the dashboard's gap analysis to other campus systems.
+#
+#   GET  /health
+#   GET  /courses
+#   GET  /gap-analysis?course=...&categories=A,B&job_relevance=0.5&course_coverage=0.3&gap_severity=0.2
+#   POST /gap-analysis        {"course": ..., "categories": [...], "thresholds": {...}}
+#   POST /gap-analysis/bulk   {"requests": [{...}, ...]}
+#
+# Scores are loaded once per process, requests are served by a bounded worker pool and
+# responses are cached by a hash of the normalised request. Each pool task serves one
+# request; idle keep-alive connections wait in a selector without holding a worker.
+
+default_thresholds = {"job_relevance": 0.5, "course_coverage": 0.3, "gap_severity": 0.2}
+
+
+class RequestError(ValueError):
+    pass
+
+
+class GapAnalysisService:
+    def __init__(self, cache_size=1024):
+        # Warm in-memory state shared by every worker
+        self.scores = get_simulated_scores()
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def courses(self):
+        return {"courses": list(self.scores.keys()), "categories": list(skills_by_category.keys()),
+                "thresholds": default_thresholds}
+
+    # Validate a request and put it in canonical form so equivalent requests share a cache entry
+    def normalize(self, request):
+        if not isinstance(request, dict):
+            raise RequestError("Request must be a JSON object")
+
+        course = request.get("course")
+        if not isinstance(course, str) or course not in self.scores:
+            raise RequestError(f"Unknown course: {course!r}")
+
+        categories = request.get("categories") or list(skills_by_category.keys())
+        if not isinstance(categories, list) or not all(isinstance(c, str) for c in categories):
+            raise RequestError("'categories' must be a list of category names")
+        unknown = [c for c in categories if c not in skills_by_category]
+        if unknown:
+            raise RequestError(f"Unknown categories: {', '.join(unknown)}")
+
+        overrides = request.get("thresholds") or {}
+        if not isinstance(overrides, dict):
+            raise RequestError("'thresholds' must be an object")
+        thresholds = dict(default_thresholds)
+        for name, value in overrides.items():
+            if name not in default_thresholds:
+                raise RequestError(f"Unknown threshold: {name!r}")
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise RequestError(f"Threshold {name} must be a number")
+            if not 0.0 <= value <= 1.0:
+                raise RequestError(f"Threshold {name} must be between 0 and 1")
+            thresholds[name] = value
+
+        return {
+            "course": course,
+            "categories": [c for c in skills_by_category if c in categories],
+            "thresholds": thresholds
+        }
+
+    def analyze(self, request):
+        request = self.normalize(request)
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return self.cache[key]
+            self.misses += 1
+
+        filtered_skills = [skill for category in request["categories"] for skill in skills_by_category[category]]
+        thresholds = request["thresholds"]
+        alignment = AlignmentState(self.scores[request["course"]], filtered_skills, skill_to_category,
+                                   thresholds["job_relevance"], thresholds["course_coverage"],
+                                   thresholds["gap_severity"])
+        result = {**request, **alignment.summary()}
+
+        with self.lock:
+            self.cache[key] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return result
+
+    # Analyse many requests in one call; invalid entries report an error in place
+    def analyze_bulk(self, requests):
+        if not isinstance(requests, list):
+            raise RequestError("'requests' must be a list")
+        results = []
+        for request in requests:
+            try:
+                results.append(self.analyze(request))
+            except RequestError as e:
+                results.append({"error": str(e)})
+        return {"results": results}
+
+    def stats(self):
+        with self.lock:
+            return {"status": "ok", "cached": len(self.cache), "cache_hits": self.hits, "cache_misses": self.misses}
+
+
+class GapAnalysisHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY keep-alive clients
+    # wait on delayed ACKs (~40 ms per response)
+    disable_nagle_algorithm = True
+    # Seconds to wait for the rest of a request once it has started arriving
+    timeout = 5
+
+    # Set up the connection only; the server calls handle_one_request once per pool task
+    def __init__(self, request, client_address, server):
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        self.setup()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            return self._send(200, self.server.service.stats())
+        if url.path == "/courses":
+            return self._send(200, self.server.service.courses())
+        if url.path == "/gap-analysis":
+            query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            request = {
+                "course": query.get("course"),
+                "categories": [c for c in query.get("categories", "").split(",") if c],
+                "thresholds": {name: query[name] for name in default_thresholds if name in query}
+            }
+            return self._handle(self.server.service.analyze, request)
+        self._send(404, {"error": f"Not found: {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, json.JSONDecodeError):
+            return self._send(400, {"error": "Request body must be valid JSON"})
+
+        if url.path == "/gap-analysis":
+            return self._handle(self.server.service.analyze, body)
+        if url.path == "/gap-analysis/bulk":
+            return self._handle(self.server.service.analyze_bulk, body.get("requests") if isinstance(body, dict) else None)
+        self._send(404, {"error": f"Not found: {url.path}"})
+
+    def _handle(self, func, payload):
+        try:
+            result = func(payload)
+        except RequestError as e:
+            return self._send(400, {"error": str(e)})
+        except Exception:
+            self.log_error("Unhandled error\n%s", traceback.format_exc())
+            return self._send(500, {"error": "Internal server error"})
+        self._send(200, result)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+# HTTP server that serves requests on a fixed-size thread pool. New connections and
+# keep-alive connections between requests are parked in a selector watched by a single
+# thread, and a connection only goes to the pool once it is readable. A pool task handles
+# one request, so idle clients never hold a worker.
+class PooledHTTPServer(HTTPServer):
+    request_queue_size = 128
+    # Parked connections are closed after this many idle seconds
+    keep_alive_timeout = 15
+
+    def __init__(self, address, service, workers=8, quiet=False):
+        super().__init__(address, GapAnalysisHandler)
+        self.service = service
+        self.quiet = quiet
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gap-api")
+        self.idle = selectors.DefaultSelector()
+        self.parking = queue.SimpleQueue()
+        self.wakeup_read, self.wakeup_write = socket.socketpair()
+        self.idle.register(self.wakeup_read, selectors.EVENT_READ)
+        self.closing = False
+        self.watcher = threading.Thread(target=self._watch_idle, name="gap-api-idle", daemon=True)
+        self.watcher.start()
+
+    def process_request(self, request, client_address):
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        self._park(handler)
+
+    # Hand a connection to the watcher thread until its next request arrives
+    def _park(self, handler):
+        self.parking.put(handler)
+        self.wakeup_write.send(b"\0")
+
+    def _serve_one(self, handler):
+        try:
+            handler.close_connection = True
+            handler.handle_one_request()
+        except Exception:
+            handler.close_connection = True
+            self.handle_error(handler.request, handler.client_address)
+        if handler.close_connection or self.closing:
+            self._close(handler)
+        elif self._has_buffered_request(handler):
+            # A pipelined request is already buffered, so the socket may never become readable
+            self.executor.submit(self._serve_one, handler)
+        else:
+            self._park(handler)
+
+    @staticmethod
+    def _has_buffered_request(handler):
+        handler.connection.settimeout(0)
+        try:
+            return bool(handler.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            handler.connection.settimeout(handler.timeout)
+
+    def _close(self, handler):
+        try:
+            handler.finish()
+        except OSError:
+            pass
+        self.shutdown_request(handler.request)
+
+    # Runs on the watcher thread, which owns every selector registration
+    def _watch_idle(self):
+        while not self.closing:
+            for key, _ in self.idle.select(timeout=1.0):
+                if key.fileobj is self.wakeup_read:
+                    self.wakeup_read.recv(4096)
+                    continue
+                self.idle.unregister(key.fileobj)
+                self.executor.submit(self._serve_one, key.data[0])
+
+            while True:
+                try:
+                    handler = self.parking.get_nowait()
+                except queue.Empty:
+                    break
+                deadline = time.monotonic() + self.keep_alive_timeout
+                self.idle.register(handler.connection, selectors.EVENT_READ, (handler, deadline))
+
+            now = time.monotonic()
+            for key in list(self.idle.get_map().values()):
+                if key.data is not None and key.data[1] < now:
+                    self.idle.unregister(key.fileobj)
+                    self._close(key.data[0])
+
+        for key in list(self.idle.get_map().values()):
+            if key.data is not None:
+                self._close(key.data[0])
+
+    def server_close(self):
+        super().server_close()
+        self.closing = True
+        self.wakeup_write.send(b"\0")
+        self.watcher.join()
+        self.executor.shutdown(wait=True)
+        while True:
+            try:
+                self._close(self.parking.get_nowait())
+            except queue.Empty:
+                break
+        self.idle.close()
+        self.wakeup_read.close()
+        self.wakeup_write.close()
+
+
+def create_server(host="127.0.0.1", port=8600, workers=8, cache_size=1024, quiet=False):
+    return PooledHTTPServer((host, port), GapAnalysisService(cache_size), workers, quiet)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the curriculum gap analysis over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--cache-size", type=int, default=1024)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.workers, args.cache_size, args.quiet)
+    print(f"Serving gap analysis on http://{args.host}:{server.server_address[1]} with {args.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time
+
+from alignment_data import get_simulated_scores, skills_by_category
+from api_server import create_server
+
+# Local load test for api_server.py. Starts the server in-process on a free port, then
+# keeps N client connections busy with gap-analysis requests drawn from a pool of distinct
+# request bodies (a small pool means mostly cache hits) and reports throughput and latency.
+# Clients outnumber workers by default, and a set of idle keep-alive connections stays open
+# throughout, so the tail latencies include waiting for a free worker.
+
+
+def request_pool(size, seed=11):
+    rng = random.Random(seed)
+    courses = list(get_simulated_scores().keys())
+    categories = list(skills_by_category.keys())
+    pool = []
+    for _ in range(size):
+        pool.append({
+            "course": rng.choice(courses),
+            "categories": rng.sample(categories, rng.randint(1, len(categories))),
+            "thresholds": {
+                "job_relevance": round(rng.uniform(0.3, 0.8), 2),
+                "course_coverage": round(rng.uniform(0.2, 0.6), 2),
+                "gap_severity": round(rng.uniform(0.1, 0.4), 2)
+            }
+        })
+    return pool
+
+
+def client(port, pool, deadline, latencies, errors, path="/gap-analysis", bulk_size=1, seed=0):
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    while time.perf_counter() < deadline:
+        if bulk_size > 1:
+            body = {"requests": [rng.choice(pool) for _ in range(bulk_size)]}
+        else:
+            body = rng.choice(pool)
+        started = time.perf_counter()
+        connection.request("POST", path, json.dumps(body), {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - started)
+        if response.status != 200:
+            errors.append(response.status)
+    connection.close()
+
+
+def run_scenario(port, pool, clients, seconds, path="/gap-analysis", bulk_size=1):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + seconds
+    threads = [threading.Thread(target=client, args=(port, pool, deadline, latencies, errors, path, bulk_size, i))
+               for i in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "analyses": len(latencies) * bulk_size,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "max_ms": max(latencies) * 1000,
+        "errors": len(errors)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the gap analysis HTTP API")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--bulk-size", type=int, default=50)
+    parser.add_argument("--idle-connections", type=int, default=16,
+                        help="Keep-alive connections that make one request and then stay open")
+    args = parser.parse_args()
+
+    server = create_server(port=0, workers=args.workers, cache_size=100_000, quiet=True)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    idle = []
+    for _ in range(args.idle_connections):
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        connection.request("GET", "/health")
+        connection.getresponse().read()
+        idle.append(connection)
+
+    scenarios = [
+        ("cold (all distinct)", request_pool(1_000_000), "/gap-analysis", 1),
+        ("warm (200 distinct)", request_pool(200, seed=12), "/gap-analysis", 1),
+        (f"bulk x{args.bulk_size} (warm)", request_pool(200, seed=12), "/gap-analysis/bulk", args.bulk_size),
+    ]
+
+    print(f"{'scenario':<22} {'requests':>9} {'analyses':>9} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'errors':>7}")
+    for name, pool, path, bulk_size in scenarios:
+        r = run_scenario(port, pool, args.clients, args.seconds, path, bulk_size)
+        print(f"{name:<22} {r['requests']:>9} {r['analyses']:>9} {r['rps']:>9.0f} {r['p50_ms']:>8.2f} "
+              f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f} {r['errors']:>7}")
+    print(json.dumps(server.service.stats()))
+
+    for connection in idle:
+        connection.close()
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
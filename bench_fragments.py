@@ -0,0 +1,152 @@
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+# Before/after benchmark for the fragment-scoped page sections. The dashboard is served by
+# a real Streamlit server and driven over its websocket like a browser would, once with
+# fragments disabled (DASHBOARD_FRAGMENTS=0, every interaction reruns the whole script) and
+# once with them enabled. For each interaction we record the rerun time (request sent until
+# script_finished) and the bytes the server pushed to the client.
+
+_FINISHED = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class DashboardClient:
+    def __init__(self, connection):
+        self.connection = connection
+        self.widget_states = {}
+        self.widgets = {}
+
+    # Send a rerun request and collect messages until the run finishes
+    async def rerun(self, fragment_id=""):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.widget_states.values())
+
+        started = time.perf_counter()
+        await self.connection.write_message(msg.SerializeToString(), binary=True)
+        received = 0
+        while True:
+            raw = await self.connection.read_message()
+            if raw is None:
+                raise RuntimeError("Streamlit server closed the connection")
+            received += len(raw)
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            if forward.WhichOneof("type") == "delta":
+                self._record_widget(forward.delta)
+            elif forward.WhichOneof("type") == "script_finished" and forward.script_finished in _FINISHED:
+                return time.perf_counter() - started, received
+
+    # Remember widget ids and the fragment that owns them
+    def _record_widget(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind in ("checkbox", "radio", "button", "slider"):
+            widget = getattr(element, kind)
+            self.widgets[(kind, widget.label)] = (widget.id, delta.fragment_id)
+
+    # Build the widget state a browser would send after the interaction
+    def interact(self, kind, label, **value):
+        widget_id, fragment_id = self.widgets[(kind, label)]
+        state = WidgetState(id=widget_id)
+        for field, field_value in value.items():
+            if field == "double_array_value":
+                state.double_array_value.data.extend(field_value)
+            else:
+                setattr(state, field, field_value)
+        self.widget_states[widget_id] = state
+        return widget_id, fragment_id
+
+
+async def run_interactions(port, repeats):
+    connection = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_message_size=1 << 30)
+    client = DashboardClient(connection)
+    await client.rerun()  # initial page load, includes the simulated model loading
+
+    interactions = [
+        ("What-if checkbox", "checkbox", "Docker", {"bool_value": True}, {"bool_value": False}),
+        ("Co-occurrence view", "radio", "View", {"int_value": 1}, {"int_value": 0}),
+        ("Recommendations button", "button", "💡 Generate AI Recommendations", {"trigger_value": True}, None),
+        ("Sidebar slider", "slider", "Gap Severity", {"double_array_value": [0.25]}, {"double_array_value": [0.2]}),
+    ]
+
+    results = {}
+    for name, kind, label, value, reset in interactions:
+        timings, sizes = [], []
+        for _ in range(repeats):
+            for state in (value, reset):
+                if state is None:
+                    continue
+                widget_id, fragment_id = client.interact(kind, label, **state)
+                elapsed, received = await client.rerun(fragment_id)
+                if kind == "button":
+                    # Trigger values only last for one run
+                    client.widget_states.pop(widget_id)
+                timings.append(elapsed)
+                sizes.append(received)
+        results[name] = (statistics.median(timings), statistics.median(sizes))
+
+    connection.close()
+    return results
+
+
+def benchmark(fragments, repeats):
+    port = _free_port()
+    env = dict(os.environ, DASHBOARD_FRAGMENTS="1" if fragments else "0")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "alignment_dashboard.py",
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        # Wait for the server to accept connections
+        for _ in range(300):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        return asyncio.run(run_interactions(port, repeats))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full reruns against fragment-scoped reruns")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    before = benchmark(fragments=False, repeats=args.repeats)
+    after = benchmark(fragments=True, repeats=args.repeats)
+
+    print(f"{'interaction':<24} {'before ms':>10} {'after ms':>10} {'before KB':>10} {'after KB':>10}")
+    for name in before:
+        (t0, b0), (t1, b1) = before[name], after[name]
+        print(f"{name:<24} {t0 * 1000:>10.1f} {t1 * 1000:>10.1f} {b0 / 1024:>10.1f} {b1 / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
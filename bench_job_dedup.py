@@ -0,0 +1,85 @@
+import argparse
+import itertools
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from job_dedup import _TOKEN_PATTERN, cluster_near_duplicates
+
+# Benchmark for the near-duplicate job posting stage on synthetic million-scale feeds.
+# Unique postings are built from the templates in data/cs_job_postings_500.csv and a share
+# of the feed is reposted with small edits (punctuation, casing, a trailing phrase), which
+# mirrors what scraped job boards look like. The threshold is calibrated separately on the
+# real postings file, comparing the MinHash estimate with exact Jaccard similarity.
+
+_TAIL_WORDS = ("remote hybrid onsite riyadh dammam jeddah khobar dubai cairo london berlin toronto "
+               "payments health retail logistics energy telecom gaming banking insurance media "
+               "startup enterprise agency government research consulting nonprofit").split()
+
+_REPOST_EDITS = [
+    lambda text: text.replace(".", "!", 1),
+    lambda text: text.upper(),
+    lambda text: text + " Apply today.",
+    lambda text: text.replace("Requires", "Must have"),
+    lambda text: "Reposted: " + text,
+]
+
+
+def build_feed(n_postings, duplicate_rate, seed=7):
+    rng = random.Random(seed)
+    templates = pd.read_csv("data/cs_job_postings_500.csv")["Description"].tolist()
+    n_unique = max(1, int(n_postings * (1 - duplicate_rate)))
+
+    feed = []
+    for i in range(n_unique):
+        # Append a random team/stack/location tail so postings from one template stay distinct
+        tail = " ".join(rng.choice(_TAIL_WORDS) for _ in range(8))
+        feed.append(f"{rng.choice(templates)} Team {i}: {tail}.")
+    while len(feed) < n_postings:
+        feed.append(rng.choice(_REPOST_EDITS)(feed[rng.randrange(n_unique)]))
+    rng.shuffle(feed)
+    return feed, n_postings - n_unique
+
+
+# Duplicates found in the real postings file at each threshold, by MinHash/LSH and by exact
+# all-pairs Jaccard over the same word bigrams
+def calibrate(thresholds, k=2):
+    texts = pd.read_csv("data/cs_job_postings_500.csv")["Description"].tolist()
+    shingles = []
+    for text in texts:
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        shingles.append({" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)})
+    similarity = [len(a & b) / len(a | b) for a, b in itertools.combinations(shingles, 2)]
+
+    print(f"{'threshold':>10} {'exact pairs':>12} {'removed':>10} {'largest':>10}")
+    for threshold in thresholds:
+        _, report = cluster_near_duplicates(texts, threshold=threshold, k=k)
+        exact_pairs = sum(value >= threshold for value in similarity)
+        print(f"{threshold:>10.2f} {exact_pairs:>12} {report['duplicates_removed']:>10} {report['largest_cluster']:>10}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MinHash/LSH job posting deduplication")
+    parser.add_argument("--postings", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--duplicate-rate", type=float, default=0.3)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--num-perm", type=int, default=64)
+    args = parser.parse_args()
+
+    calibrate([0.5, 0.6, 0.7, 0.8, 0.9])
+    print(f"{'postings':>10} {'injected':>10} {'removed':>10} {'clusters':>10} {'seconds':>9} {'posts/s':>10}")
+    for n_postings in args.postings:
+        feed, injected = build_feed(n_postings, args.duplicate_rate)
+        started = time.perf_counter()
+        cluster_ids, report = cluster_near_duplicates(feed, threshold=args.threshold, num_perm=args.num_perm)
+        elapsed = time.perf_counter() - started
+        print(f"{n_postings:>10} {injected:>10} {report['duplicates_removed']:>10} {report['clusters']:>10} "
+              f"{elapsed:>9.2f} {n_postings / elapsed:>10.0f}")
+        assert len(np.unique(cluster_ids)) == report["clusters"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import time
+
+from recommendation_engine import LocalRecommendationProvider, sequential_recommendations, stream_recommendations
+
+# Wall time of batched, concurrent recommendation generation against the sequential
+# one-course-per-call baseline, using the local stand-in provider with configurable latency.
+
+
+def synthetic_program(n_courses, gaps_per_course=10):
+    return {f"Course {i:03d}": [{"skill": f"skill_{j}", "overall_gap": 0.5} for j in range(gaps_per_course)]
+            for i in range(n_courses)}
+
+
+def timed(results):
+    started = time.perf_counter()
+    first = None
+    received, errors = {}, {}
+    for course_name, recommendations, error in results:
+        if first is None:
+            first = time.perf_counter() - started
+        if error:
+            errors[course_name] = error
+        else:
+            received[course_name] = recommendations
+    return time.perf_counter() - started, first, received, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched streaming recommendations")
+    parser.add_argument("--courses", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.5, help="Provider round-trip latency in seconds")
+    parser.add_argument("--per-course-latency", type=float, default=0.05)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of provider calls that fail")
+    args = parser.parse_args()
+
+    program = synthetic_program(args.courses)
+    thresholds = {"job_relevance": 0.5, "course_coverage": 0.3, "gap_severity": 0.2}
+
+    provider = LocalRecommendationProvider(args.latency, args.per_course_latency, args.batch_size, args.failure_rate)
+    sequential_time, sequential_first, sequential, sequential_errors = timed(
+        sequential_recommendations(provider, program, thresholds))
+    sequential_calls = provider.calls
+
+    provider = LocalRecommendationProvider(args.latency, args.per_course_latency, args.batch_size, args.failure_rate)
+    batched_time, batched_first, batched, batched_errors = timed(
+        stream_recommendations(provider, program, thresholds, args.batch_size, args.concurrency))
+
+    assert len(batched) + len(batched_errors) == args.courses, "batched run lost courses"
+    assert all(sequential[name] == batched[name] for name in batched.keys() & sequential.keys()), \
+        "batched results differ from the sequential baseline"
+    print(f"{'mode':<12} {'requests':>9} {'failed':>7} {'first result s':>15} {'wall time s':>12}")
+    print(f"{'sequential':<12} {sequential_calls:>9} {len(sequential_errors):>7} {sequential_first:>15.2f} "
+          f"{sequential_time:>12.2f}")
+    print(f"{'batched':<12} {provider.calls:>9} {len(batched_errors):>7} {batched_first:>15.2f} {batched_time:>12.2f}")
+    print(f"speedup: {sequential_time / batched_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+# Columnar copies of the CSV inputs in data/. Each CSV is validated against its schema and
+# written once to an uncompressed Arrow IPC file that is memory-mapped on load, so loaders
+# only touch the columns they select instead of re-parsing CSV text on every start.
+# A copy is rebuilt automatically when the SHA-256 of its source CSV changes. Rebuilds are
+# serialised by a thread lock (dashboard sessions run in threads) and a file lock (setup.sh
+# and a running app), and every file is written under a unique temp name and moved into place.
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+COLUMNAR_DIR = os.path.join(DATA_DIR, "columnar")
+MANIFEST_PATH = os.path.join(COLUMNAR_DIR, "manifest.json")
+LOCK_PATH = os.path.join(COLUMNAR_DIR, ".lock")
+
+_conversion_lock = threading.Lock()
+
+_COURSE_SCHEMA = pa.schema([("Course_Code", pa.string()), ("Course_Name", pa.string()), ("Outcome", pa.string())])
+_JOB_SCHEMA = pa.schema([("Job_ID", pa.string()), ("Job_Title", pa.string()), ("Description", pa.string())])
+_STANDARD_SCHEMA = pa.schema([("Standard_ID", pa.string()), ("Category", pa.string()), ("Competency", pa.string())])
+
+# name: (source CSV, schema, column that must be unique or None)
+datasets = {
+    "courses": ("cs_course_outcomes.csv", _COURSE_SCHEMA, None),
+    "jobs": ("cs_job_postings_500.csv", _JOB_SCHEMA, "Job_ID"),
+    "cs2023_standards": ("cs2023_standards.csv", _STANDARD_SCHEMA, "Standard_ID"),
+    "csta_standards": ("csta_standards.csv", _STANDARD_SCHEMA, "Standard_ID"),
+    "abet_standards": ("abet_standards.csv", _STANDARD_SCHEMA, "Standard_ID"),
+    "global_standards": ("global_cs_standards.csv", _STANDARD_SCHEMA, "Standard_ID"),
+}
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def source_path(name):
+    return os.path.join(DATA_DIR, datasets[name][0])
+
+
+def columnar_path(name):
+    return os.path.join(COLUMNAR_DIR, f"{name}.arrow")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Check required columns, missing values and unique ids; returns the table cast to the schema
+def validate(name, table):
+    _, schema, unique_column = datasets[name]
+    missing = [field.name for field in schema if field.name not in table.column_names]
+    if missing:
+        raise SchemaError(f"{name}: missing required column(s) {', '.join(missing)}")
+
+    for field in schema:
+        column = table.column(field.name)
+        empty = column.null_count + (pc.sum(pc.equal(pc.utf8_trim_whitespace(column), "")).as_py() or 0)
+        if empty:
+            raise SchemaError(f"{name}: {empty} row(s) with an empty {field.name}")
+
+    if unique_column and pc.count_distinct(table.column(unique_column)).as_py() != table.num_rows:
+        raise SchemaError(f"{name}: duplicate values in {unique_column}")
+
+    # Required columns first, in schema order, followed by any extra columns
+    extra = [column for column in table.column_names if column not in schema.names]
+    return table.select(schema.names + extra).cast(pa.schema(list(schema) + [table.schema.field(c) for c in extra]))
+
+
+# Hold the conversion lock: one thread in this process, one process on this data folder
+@contextmanager
+def conversion_lock():
+    with _conversion_lock:
+        os.makedirs(COLUMNAR_DIR, exist_ok=True)
+        with open(LOCK_PATH, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+
+# Yield a unique temp path next to target; it replaces target if the block succeeds
+@contextmanager
+def replacing(target):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=os.path.basename(target) + ".",
+                                    suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_manifest():
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def _write_manifest(manifest):
+    with replacing(MANIFEST_PATH) as tmp_path:
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+# Parse, validate and write one dataset to its Arrow IPC file
+def convert(name, sha256=None):
+    with conversion_lock():
+        return _convert(name, sha256)
+
+
+def _convert(name, sha256=None):
+    source = source_path(name)
+    _, schema, _ = datasets[name]
+    if os.path.getsize(source) == 0:
+        raise SchemaError(f"{name}: {source} is empty")
+
+    try:
+        table = pacsv.read_csv(source, convert_options=pacsv.ConvertOptions(
+            column_types={field.name: field.type for field in schema},
+            strings_can_be_null=True
+        ))
+    except pa.ArrowInvalid as e:
+        raise SchemaError(f"{name}: {e}") from e
+    table = validate(name, table)
+
+    with replacing(columnar_path(name)) as tmp_path:
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    stat = os.stat(source)
+    manifest = _read_manifest()
+    manifest[name] = {
+        "source": source,
+        "sha256": sha256 or file_sha256(source),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "rows": table.num_rows,
+    }
+    _write_manifest(manifest)
+    return manifest[name]
+
+
+# Manifest entry if the columnar copy matches its source by size and mtime, else None
+def _fresh_entry(name):
+    entry = _read_manifest().get(name)
+    if entry is None or not os.path.exists(columnar_path(name)):
+        return None
+    stat = os.stat(source_path(name))
+    if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry
+    return None
+
+
+# Rebuild the columnar copy if its source CSV changed. Unchanged size and mtime skip hashing
+# and locking; otherwise the hash decides under the lock, so touching a file without editing
+# it does not force a rebuild and concurrent callers rebuild it only once.
+def ensure_current(name):
+    entry = _fresh_entry(name)
+    if entry is not None:
+        return entry, False
+
+    with conversion_lock():
+        entry = _fresh_entry(name)
+        if entry is not None:
+            return entry, False
+        return _refresh(name)
+
+
+def _refresh(name):
+    source = source_path(name)
+    entry = _read_manifest().get(name)
+    if entry is None or not os.path.exists(columnar_path(name)):
+        return _convert(name), True
+
+    stat = os.stat(source)
+    sha256 = file_sha256(source)
+    if sha256 != entry["sha256"]:
+        return _convert(name, sha256), True
+
+    manifest = _read_manifest()
+    manifest[name].update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    _write_manifest(manifest)
+    return manifest[name], False
+
+
+# Content hash of a dataset's source CSV, rebuilding its columnar copy if the CSV changed,
+# or None when the source is missing or empty. Cached loaders take it as an argument so a
+# changed CSV gives them a new cache key.
+def dataset_version(name):
+    source = source_path(name)
+    if not os.path.exists(source) or os.path.getsize(source) == 0:
+        return None
+    return ensure_current(name)[0]["sha256"]
+
+
+# Memory-map the columnar copy and read only the requested columns. Record batches are
+# zero-copy views into the mapping, so pages of unselected columns are never read.
+def load_table(name, columns=None):
+    ensure_current(name)
+    table = pa.ipc.open_file(pa.memory_map(columnar_path(name), "r")).read_all()
+    return table.select(columns) if columns else table
+
+
+def load_dataframe(name, columns=None):
+    return load_table(name, columns).to_pandas()
+
+
+# Convert every dataset and print what was rebuilt; exits non-zero if any dataset failed
+def main():
+    failed = 0
+    for name in datasets:
+        try:
+            entry, rebuilt = ensure_current(name)
+        except (SchemaError, FileNotFoundError) as e:
+            print(f"{name:<18} ERROR  {e}")
+            failed += 1
+            continue
+        print(f"{name:<18} {'built ' if rebuilt else 'cached'} {entry['rows']:>7} rows  sha256={entry['sha256'][:12]}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
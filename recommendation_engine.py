@@ -0,0 +1,138 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Batched recommendation generation. Instead of one provider round-trip per course, the gap
+# lists of many courses are grouped into bounded-size batch requests that are dispatched
+# concurrently, and per-course results are streamed back as each batch completes.
+
+# Pre-written course-specific recommendations used by the simulated provider
+course_recommendations = {
+    "Introduction to Programming": [
+        f"Integrate Git version control into programming assignments to teach students industry-standard collaboration practices. Setup a classroom GitHub organization with repositories for each project.",
+        f"Add a module on REST API fundamentals using Python requests library to introduce students to web services concepts. Implement simple API projects using public APIs.",
+        f"Introduce Java as a secondary language with comparisons to Python to broaden students' programming language knowledge. Create parallel assignments to implement the same solution in both languages."
+    ],
+    "Data Structures": [
+        f"Add practical applications of data structures in web development contexts using JavaScript, showing how structures like trees and graphs apply to DOM manipulation and state management.",
+        f"Incorporate version control using Git throughout coursework, requiring proper commit messages and branching strategies for collaborative data structure implementations.",
+        f"Introduce cloud-based implementations (AWS) of data structures to demonstrate scalability considerations with large datasets that exceed local memory constraints."
+    ],
+    "Algorithms": [
+        f"Implement a module on machine learning algorithms that builds on the theoretical foundations already covered in the course. Show connections between classic algorithms and their ML applications.",
+        f"Add a practical project applying algorithms to security challenges, including encryption, authentication, and secure coding practices to address the gap in security knowledge.",
+        f"Incorporate visualization exercises using data visualization tools to help students understand algorithm performance and complexity in real-world scenarios."
+    ],
+    "Web Development": [
+        f"Enhance the curriculum with Docker containerization for web applications, teaching students to create reproducible development environments and deployment packages.",
+        f"Add a module on serverless deployment using AWS Lambda and API Gateway to teach modern cloud-based web application architecture and scaling.",
+        f"Incorporate security-focused exercises addressing common web vulnerabilities (XSS, CSRF, SQL injection) to improve students' defensive coding practices."
+    ],
+    "Database Systems": [
+        f"Integrate cloud database solutions (AWS RDS, DynamoDB) alongside traditional database systems to teach modern deployment and scaling considerations.",
+        f"Add a CI/CD pipeline component for database schema migrations and automated testing to expose students to DevOps practices specific to database management.",
+        f"Incorporate a module on data visualization and dashboard creation to connect database knowledge with practical reporting and business intelligence applications."
+    ]
+}
+
+# Generic recommendations if course not found
+generic_recommendations = [
+    "Incorporate version control and collaborative development practices using Git and GitHub Classroom.",
+    "Add industry-relevant projects that connect theoretical concepts to practical applications.",
+    "Integrate cloud computing concepts and tools to prepare students for modern development environments."
+]
+
+
+def canned_recommendations(course_name):
+    return course_recommendations.get(course_name, generic_recommendations)
+
+
+class ProviderError(RuntimeError):
+    pass
+
+
+# Local stand-in for the LLM provider. A request costs a fixed round-trip latency plus a
+# per-course generation cost, so batching saves the round-trips but not the generation.
+# failure_rate makes a share of calls fail, to exercise error handling.
+class LocalRecommendationProvider:
+    def __init__(self, latency=2.0, per_course_latency=0.1, max_batch_size=8, failure_rate=0.0, seed=0):
+        self.latency = latency
+        self.per_course_latency = per_course_latency
+        self.max_batch_size = max_batch_size
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    # requests: list of {"course_name", "gap_count", "top_gaps", "thresholds"};
+    # returns {course_name: [recommendations]}
+    def recommend_batch(self, requests):
+        if len(requests) > self.max_batch_size:
+            raise ValueError(f"Batch of {len(requests)} courses exceeds the provider limit of {self.max_batch_size}")
+        with self.lock:
+            self.calls += 1
+            failed = self.random.random() < self.failure_rate
+        time.sleep(self.latency + self.per_course_latency * len(requests))
+        if failed:
+            raise ProviderError(f"Provider failed on a batch of {len(requests)} course(s)")
+        return {request["course_name"]: canned_recommendations(request["course_name"]) for request in requests}
+
+
+# Build one provider request per course from its gap list
+def build_requests(course_gaps, thresholds):
+    return [{
+        "course_name": course_name,
+        "gap_count": len(gaps),
+        "top_gaps": [g["skill"] for g in gaps[:5]],
+        "thresholds": thresholds
+    } for course_name, gaps in course_gaps.items()]
+
+
+# Group requests into batches of at most batch_size courses
+def make_batches(requests, batch_size):
+    return [requests[i:i + batch_size] for i in range(0, len(requests), batch_size)]
+
+
+# Call the provider for one batch, retrying failed calls
+def _recommend_with_retries(provider, batch, retries):
+    for attempt in range(retries + 1):
+        try:
+            return provider.recommend_batch(batch)
+        except Exception:
+            if attempt == retries:
+                raise
+
+
+# Dispatch batched requests concurrently and yield (course_name, recommendations, error) as
+# each batch completes, so callers can render results before the whole program is done.
+# A batch that still fails after its retries yields an error for each of its courses
+# instead of aborting the other batches.
+def stream_recommendations(provider, course_gaps, thresholds, batch_size=None, max_concurrency=4, retries=1):
+    batch_size = min(batch_size or provider.max_batch_size, provider.max_batch_size)
+    batches = make_batches(build_requests(course_gaps, thresholds), batch_size)
+    if not batches:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+        futures = {executor.submit(_recommend_with_retries, provider, batch, retries): batch for batch in batches}
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                for request in futures[future]:
+                    yield request["course_name"], None, str(e)
+                continue
+            for course_name, recommendations in results.items():
+                yield course_name, recommendations, None
+
+
+# Sequential baseline: one provider round-trip per course
+def sequential_recommendations(provider, course_gaps, thresholds, retries=1):
+    for request in build_requests(course_gaps, thresholds):
+        try:
+            results = _recommend_with_retries(provider, [request], retries)
+        except Exception as e:
+            yield request["course_name"], None, str(e)
+            continue
+        yield request["course_name"], results[request["course_name"]], None
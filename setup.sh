@@ -21,4 +21,8 @@ if [ ! -f "Header_img.png" ]; then
     fi
 fi
 
+# Validate the CSV inputs and build their columnar copies (rebuilt automatically on load
+# whenever a CSV changes)
+python data_store.py
+
 echo "Setup complete!"
\ No newline at end of file
@@ -0,0 +1,134 @@
+import re
+import threading
+
+import numpy as np
+import scipy.sparse as sp
+
+# Skill co-occurrence from job postings. Postings are turned into a sparse posting x skill
+# incidence matrix X and the skill x skill co-occurrence counts are the single product X^T X,
+# so the cost scales with the number of skill mentions rather than with n_skills^2.
+
+
+# Tokens keep dotted/slashed names such as "node.js" and "ci/cd" together
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[./][a-z0-9+#]+)*")
+_COMPOUND_SPLIT = re.compile(r"[./]")
+
+
+# Map each skill's normalised token sequence to its column. Matching postings by token
+# n-gram lookup keeps extraction cost independent of the number of skills, unlike one
+# regex search (or one big alternation) per skill.
+def skill_vocabulary(skills):
+    lookup = {" ".join(_TOKEN_PATTERN.findall(skill.lower())): i for i, skill in enumerate(skills)}
+    max_words = max((len(key.split()) for key in lookup), default=1)
+    return lookup, max_words
+
+
+# Skill columns mentioned in one text
+def _skill_columns(text, lookup, max_words):
+    tokens = _TOKEN_PATTERN.findall(str(text).lower())
+    found = set()
+    for i, token in enumerate(tokens):
+        for n in range(1, max_words + 1):
+            column = lookup.get(" ".join(tokens[i:i + n]))
+            if column is not None:
+                found.add(column)
+        if token not in lookup and ("." in token or "/" in token):
+            # "python/java" should still count as Python and Java
+            found.update(lookup[part] for part in _COMPOUND_SPLIT.split(token) if part in lookup)
+    return found
+
+
+# Build the binary posting x skill incidence matrix (CSR) for a list of texts
+def incidence_matrix(texts, skills, vocabulary=None):
+    lookup, max_words = vocabulary or skill_vocabulary(skills)
+
+    indptr, indices = [0], []
+    for text in texts:
+        indices.extend(sorted(_skill_columns(text, lookup, max_words)))
+        indptr.append(len(indices))
+
+    data = np.ones(len(indices), dtype=np.float64)
+    return sp.csr_matrix((data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+                         shape=(len(indptr) - 1, len(skills)))
+
+
+# Incrementally maintained co-occurrence counts. New postings only cost X_new^T X_new,
+# and postings already ingested (by key) are skipped so the index can be refreshed cheaply.
+class CooccurrenceIndex:
+    def __init__(self, skills):
+        self.skills = list(skills)
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self.vocabulary = skill_vocabulary(self.skills)
+        self.counts = sp.csr_matrix((len(self.skills), len(self.skills)), dtype=np.float64)
+        self.n_postings = 0
+        self.seen_keys = set()
+        self._lock = threading.Lock()
+
+    # Add postings; keys identify postings so re-adding the same feed is a no-op
+    def add_postings(self, texts, keys=None):
+        with self._lock:
+            texts = list(texts)
+            if keys is not None:
+                fresh = [(key, text) for key, text in zip(keys, texts) if key not in self.seen_keys]
+                self.seen_keys.update(key for key, _ in fresh)
+                texts = [text for _, text in fresh]
+            if not texts:
+                return 0
+
+            incidence = incidence_matrix(texts, self.skills, self.vocabulary)
+            self.counts = (self.counts + incidence.T @ incidence).tocsr()
+            self.n_postings += len(texts)
+            return len(texts)
+
+    # Number of postings mentioning each skill (the diagonal of X^T X)
+    def skill_counts(self):
+        return self.counts.diagonal()
+
+    # Off-diagonal co-occurrence scores as a sparse matrix.
+    # measure: "count", "lift" (P(a,b) / P(a)P(b)) or "pmi" (log2 lift)
+    def scores(self, measure="pmi", min_count=1):
+        pairs = sp.triu(self.counts, k=1).tocoo()
+        keep = pairs.data >= min_count
+        rows, cols, data = pairs.row[keep], pairs.col[keep], pairs.data[keep]
+
+        if measure == "count":
+            values = data
+        else:
+            totals = self.skill_counts()
+            lift = data * self.n_postings / (totals[rows] * totals[cols])
+            if measure == "lift":
+                values = lift
+            elif measure == "pmi":
+                values = np.log2(lift)
+            else:
+                raise ValueError(f"Unknown co-occurrence measure: {measure}")
+
+        upper = sp.csr_matrix((values, (rows, cols)), shape=self.counts.shape)
+        return (upper + upper.T).tocsr()
+
+    # Top skill pairs as a list of dicts, sorted by the chosen measure
+    def top_pairs(self, n=20, measure="pmi", min_count=2, subset=None):
+        counts = sp.triu(self.counts, k=1).tocsr()
+        pairs = sp.triu(self.scores(measure, min_count), k=1).tocoo()
+        rows, cols, values = pairs.row, pairs.col, pairs.data
+
+        if subset is not None:
+            allowed = np.zeros(len(self.skills), dtype=bool)
+            allowed[[self.skill_index[skill] for skill in subset if skill in self.skill_index]] = True
+            keep = allowed[rows] & allowed[cols]
+            rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        order = np.argsort(-values, kind="stable")[:n]
+        pairs = []
+        for i in order:
+            pair = {"skill_a": self.skills[rows[i]], "skill_b": self.skills[cols[i]],
+                    "count": int(counts[rows[i], cols[i]])}
+            if measure != "count":
+                pair[measure] = float(values[i])
+            pairs.append(pair)
+        return pairs
+
+    # Dense score matrix restricted to a subset of skills, for heatmaps
+    def submatrix(self, subset, measure="pmi", min_count=1):
+        index = [self.skill_index[skill] for skill in subset]
+        return self.scores(measure, min_count)[index][:, index].toarray()
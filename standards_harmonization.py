@@ -0,0 +1,290 @@
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import scipy.sparse as sp
+
+from data_store import COLUMNAR_DIR, DATA_DIR, ensure_current, load_dataframe, replacing
+
+# Harmonization of the four standards frameworks (ABET, CS2023, CSTA, GCS) into canonical
+# standard groups. Competencies are compared with a TF-IDF cosine similarity join, but only
+# within blocks of rows that share a normalised Category keyword, so the join avoids the
+# full cross product. Equivalent competencies are clustered into groups and the mapping is
+# saved next to the columnar data, rebuilt when any source file changes. The threshold is
+# calibrated against reviewed pairs in data/standards_match_labels.csv (see calibrate).
+
+standard_datasets = ["abet_standards", "cs2023_standards", "csta_standards", "global_standards"]
+
+# Lowest threshold whose grouping precision on the reviewed pairs reaches 0.8 (0.83, with
+# recall 0.54); 0.40 recovers more pairs but merges 5 non-equivalent ones. Rerun
+# "python standards_harmonization.py calibrate" after editing the standards or the labels.
+default_threshold = 0.42
+# Bump when the grouping method changes so saved mappings are rebuilt
+_GROUPING_VERSION = "2"
+
+GROUPS_PATH = os.path.join(COLUMNAR_DIR, "standard_groups.arrow")
+LABELS_PATH = os.path.join(DATA_DIR, "standards_match_labels.csv")
+
+_WORD_PATTERN = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = set("""
+    a an and as at by e for from g i in into its like of on or the their to use using with
+    understand apply develop implement design analyze evaluate ensure basic basics
+    stay updated emerging trends contribute engage share ideas effectively clearly
+""".split())
+
+# Category words that are too generic to block on
+_GENERIC_CATEGORY_WORDS = {"computing", "computer", "fundamentals", "advanced", "core", "concepts", "knowledge",
+                           "technical", "special", "specialized", "topics", "skills", "issues", "platforms"}
+
+# Category words that name the same area in different frameworks
+_CATEGORY_SYNONYMS = {
+    "cybersecurity": "security", "safety": "security",
+    "networks": "network", "networking": "network", "internet": "network",
+    "algorithms": "algorithm", "complexity": "algorithm",
+    "programming": "programming", "languages": "programming", "software": "programming",
+    "ai": "ai", "artificial": "ai", "intelligence": "ai", "machine": "ai", "learning": "ai",
+    "data": "data", "analysis": "data", "management": "data", "science": "data",
+    "ethics": "ethics", "social": "ethics", "impacts": "ethics", "society": "ethics",
+    "professional": "professional", "practice": "professional", "development": "professional",
+    "teamwork": "professional", "collaboration": "professional", "lifelong": "professional",
+    "systems": "systems", "architecture": "systems", "hardware": "systems", "distributed": "systems",
+    "parallel": "systems", "thinking": "systems",
+    "theory": "theory", "abstraction": "theory", "computational": "theory",
+    "graphics": "graphics", "visualization": "graphics", "vr": "graphics", "human": "graphics",
+    "robotics": "robotics", "iot": "robotics",
+    "design": "design", "engineering": "design", "problem": "design", "solving": "design",
+}
+
+
+# Very small suffix stemmer so "ethical"/"ethics" and "secure"/"security" share a term
+def _stem(word):
+    for suffix, replacement in (("ations", "ate"), ("ation", "ate"), ("ities", ""), ("ity", ""), ("ical", "ic"),
+                                ("ing", ""), ("ies", "y"), ("ed", ""), ("es", ""), ("s", ""), ("e", "")):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:len(word) - len(suffix)] + replacement
+    return word
+
+
+def competency_terms(text):
+    return [_stem(word) for word in _WORD_PATTERN.findall(str(text).lower()) if word not in _STOPWORDS]
+
+
+# Blocking keys for a category: its normalised, non-generic words
+def blocking_keys(category):
+    words = _WORD_PATTERN.findall(str(category).lower())
+    keys = {_CATEGORY_SYNONYMS.get(word, _stem(word)) for word in words
+            if word not in _STOPWORDS and word not in _GENERIC_CATEGORY_WORDS}
+    return keys or {str(category).lower()}
+
+
+# L2-normalised TF-IDF rows for the competency texts
+def tfidf_matrix(texts):
+    vocabulary = {}
+    rows, cols = [], []
+    for i, text in enumerate(texts):
+        for term in competency_terms(text):
+            rows.append(i)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+
+    counts = sp.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(texts), len(vocabulary)))
+    counts.sum_duplicates()
+    document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+    weighted = counts @ sp.diags(idf)
+    norms = np.sqrt(weighted.multiply(weighted).sum(axis=1)).A1
+    norms[norms == 0] = 1
+    return sp.diags(1 / norms) @ weighted
+
+
+def load_standards():
+    frames = []
+    for name in standard_datasets:
+        df = load_dataframe(name, columns=["Standard_ID", "Category", "Competency"])
+        df["Framework"] = df["Standard_ID"].str.split("_").str[0]
+        frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+# Cross-framework similarity join within category blocks. Returns the accepted pairs
+# (i, j, similarity) and a report comparing candidate pairs with the full cross product.
+def blocked_similarity_join(standards, threshold=default_threshold):
+    started = time.perf_counter()
+    vectors = tfidf_matrix(standards["Competency"].tolist()).tocsr()
+    frameworks = standards["Framework"].to_numpy()
+
+    blocks = {}
+    for i, category in enumerate(standards["Category"]):
+        for key in blocking_keys(category):
+            blocks.setdefault(key, []).append(i)
+
+    candidates = {}
+    for members in blocks.values():
+        members = np.asarray(members)
+        similarity = (vectors[members] @ vectors[members].T).tocoo()
+        left, right = members[similarity.row], members[similarity.col]
+        keep = (left < right) & (frameworks[left] != frameworks[right])
+        for i, j, value in zip(left[keep], right[keep], similarity.data[keep]):
+            candidates[(i, j)] = value
+
+    # Pairs that share a block but no terms have similarity 0 and never appear in the product.
+    # A row can sit in several blocks, so pairs are counted once by their (i, j) code.
+    pair_codes = []
+    for members in blocks.values():
+        members = np.asarray(members)
+        left, right = np.triu_indices(len(members), k=1)
+        left, right = members[left], members[right]
+        cross = frameworks[left] != frameworks[right]
+        pair_codes.append(np.minimum(left, right)[cross] * len(standards) + np.maximum(left, right)[cross])
+    candidate_pairs = len(np.unique(np.concatenate(pair_codes))) if pair_codes else 0
+
+    framework_sizes = pd.Series(frameworks).value_counts().to_numpy()
+    full_pairs = int((framework_sizes.sum() ** 2 - (framework_sizes ** 2).sum()) // 2)
+
+    pairs = [(i, j, value) for (i, j), value in candidates.items() if value >= threshold]
+    report = {
+        "standards": len(standards),
+        "blocks": len(blocks),
+        "full_pairs": full_pairs,
+        "candidate_pairs": int(candidate_pairs),
+        "pair_reduction": 1 - candidate_pairs / full_pairs if full_pairs else 0.0,
+        "matched_pairs": len(pairs),
+        "threshold": threshold,
+        "join_seconds": time.perf_counter() - started,
+    }
+    return pairs, vectors, report
+
+
+# Cluster matched competencies into canonical groups by star clustering: the standard with
+# the largest total similarity to its unassigned matches becomes a canonical competency and
+# takes those matches as members. Every member is therefore directly similar to its group's
+# canonical competency, rather than linked to it through a chain of matches.
+def harmonize(standards, threshold=default_threshold):
+    pairs, vectors, report = blocked_similarity_join(standards, threshold)
+    n = len(standards)
+    upper = sp.csr_matrix(([p[2] for p in pairs], ([p[0] for p in pairs], [p[1] for p in pairs])), shape=(n, n))
+    similarity = (upper + upper.T).tocsr()
+
+    labels = np.full(n, -1)
+    canonical = []
+    unassigned = np.ones(n, dtype=bool)
+    while True:
+        totals = similarity @ unassigned.astype(float)
+        totals[~unassigned] = 0
+        center = int(np.argmax(totals))
+        if totals[center] == 0:
+            break
+        members = similarity[center].indices[unassigned[similarity[center].indices]]
+        labels[center] = labels[members] = len(canonical)
+        unassigned[center] = unassigned[members] = False
+        canonical.append(center)
+    for i in np.nonzero(unassigned)[0]:
+        labels[i] = len(canonical)
+        canonical.append(i)
+
+    # Number groups in order of first appearance
+    order = {label: i for i, label in enumerate(dict.fromkeys(labels))}
+    group_index = np.array([order[label] for label in labels])
+    canonical = {order[label]: center for label, center in enumerate(canonical)}
+
+    groups = standards.assign(
+        Group_ID=[f"STD_{group + 1:03d}" for group in group_index],
+        Canonical_Standard_ID=[standards["Standard_ID"].iat[canonical[group]] for group in group_index],
+        Canonical_Competency=[standards["Competency"].iat[canonical[group]] for group in group_index],
+    )
+    report["groups"] = len(order)
+    report["merged_standards"] = n - len(order)
+    report["multi_framework_groups"] = int((groups.groupby("Group_ID")["Framework"].nunique() > 1).sum())
+    return groups, report
+
+
+# Precision of the grouping against reviewed pairs, for each threshold. A pair of standards
+# placed in the same group counts as correct if it is labelled equivalent; recall is the
+# share of labelled equivalent pairs that end up grouped together.
+def calibrate(standards, labels, thresholds):
+    equivalent = {(a, b): bool(e) for a, b, e in labels[["Standard_ID_A", "Standard_ID_B", "Equivalent"]].itertuples(
+        index=False)}
+    positives = sum(equivalent.values())
+    rows = []
+    for threshold in thresholds:
+        groups, report = harmonize(standards, threshold)
+        grouped = set()
+        for members in groups.groupby("Group_ID")["Standard_ID"]:
+            ids = sorted(members[1])
+            grouped.update((a, b) for i, a in enumerate(ids) for b in ids[i + 1:])
+        reviewed = [pair for pair in grouped if pair in equivalent]
+        correct = sum(equivalent[pair] for pair in reviewed)
+        rows.append({
+            "threshold": threshold,
+            "grouped_pairs": len(grouped),
+            "unreviewed": len(grouped) - len(reviewed),
+            "correct": correct,
+            "precision": correct / len(reviewed) if reviewed else 1.0,
+            "recall": correct / positives if positives else 0.0,
+            "groups": report["groups"],
+        })
+    return pd.DataFrame(rows)
+
+
+def _sources_fingerprint():
+    digests = [ensure_current(name)[0]["sha256"] for name in standard_datasets]
+    return hashlib.sha256("".join(digests).encode("utf-8")).hexdigest()
+
+
+# Load the saved mapping, re-running the join when a standards file or the threshold changed
+def load_standard_groups(threshold=default_threshold):
+    fingerprint = _sources_fingerprint()
+    if os.path.exists(GROUPS_PATH):
+        table = pa.ipc.open_file(pa.memory_map(GROUPS_PATH, "r")).read_all()
+        metadata = table.schema.metadata or {}
+        if (metadata.get(b"sources") == fingerprint.encode("utf-8")
+                and float(metadata.get(b"threshold", b"-1")) == threshold
+                and metadata.get(b"version") == _GROUPING_VERSION.encode("utf-8")):
+            return table.to_pandas(), json.loads(metadata[b"report"])
+
+    groups, report = harmonize(load_standards(), threshold)
+    table = pa.Table.from_pandas(groups, preserve_index=False).replace_schema_metadata({
+        "sources": fingerprint,
+        "threshold": str(threshold),
+        "version": _GROUPING_VERSION,
+        "report": json.dumps(report),
+    })
+    os.makedirs(COLUMNAR_DIR, exist_ok=True)
+    with replacing(GROUPS_PATH) as tmp_path:
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return groups, report
+
+
+# Evaluate score_fn once per canonical group and broadcast the result to every member row
+def score_by_group(groups, score_fn):
+    canonical = groups.drop_duplicates("Group_ID").set_index("Group_ID")["Canonical_Competency"]
+    scores = {group_id: score_fn(text) for group_id, text in canonical.items()}
+    return groups["Group_ID"].map(scores)
+
+
+def main():
+    if sys.argv[1:2] == ["calibrate"]:
+        table = calibrate(load_standards(), pd.read_csv(LABELS_PATH), [0.3, 0.35, 0.4, 0.42, 0.45, 0.5, 0.6])
+        print(table.to_string(index=False, float_format="{:.3f}".format))
+        return
+
+    threshold = float(sys.argv[1]) if len(sys.argv) > 1 else default_threshold
+    groups, report = harmonize(load_standards(), threshold)
+    for key, value in report.items():
+        print(f"{key:<24} {value:.4f}" if isinstance(value, float) else f"{key:<24} {value}")
+
+    multi = groups.groupby("Group_ID").filter(lambda g: g["Framework"].nunique() > 1)
+    for group_id, members in multi.groupby("Group_ID"):
+        print(f"\n{group_id}: {members['Canonical_Competency'].iat[0]}")
+        for _, row in members.iterrows():
+            print(f"    {row['Standard_ID']:<11} {row['Competency']}")
+
+
+if __name__ == "__main__":
+    main()